@@ -1,6 +1,6 @@
 import math
 import pygame
-from sudoku_generator import SudokuGenerator
+from sudoku_generator import SudokuGenerator, generate_minimal_sudoku
 from cell import Cell
 from constants import *
 
@@ -12,7 +12,7 @@ class Board:
         Parameters:
         - width (int): The width of the board.
         - height (int): The height of the board.
-        - difficulty (str): The difficulty level of the Sudoku board ("easy", "medium", or "hard").
+        - difficulty (str): The difficulty level of the Sudoku board ("easy", "medium", "hard", or "expert").
         """
         self.width = width
         self.height = height
@@ -25,16 +25,26 @@ class Board:
             removed_cells = 40
         elif self.difficulty == "hard":
             removed_cells = 50
+        elif self.difficulty == "expert":
+            removed_cells = None
+        else:
+            raise ValueError(f"unknown difficulty: {self.difficulty!r}")
 
-        sudoku_board = SudokuGenerator(NUM_SQUARES**2, removed_cells)
-        # Solve the board and make a copy
-        sudoku_board.fill_values()
-        self.solved_board = [row[:] for row in sudoku_board.get_board()]
-        # Remove cells and make a copy
-        sudoku_board.remove_cells()
-        self.original_board = [row[:] for row in sudoku_board.get_board()]
-        # Use the modified original_board for sudoku_numbers
-        self.sudoku_numbers = sudoku_board.get_board()
+        if removed_cells is None:
+            # Minimal, uniquely solvable puzzle instead of a fixed number of removed cells
+            self.solved_board, self.sudoku_numbers = generate_minimal_sudoku(
+                NUM_SQUARES**2, EXPERT_MAX_CLUES, EXPERT_MAX_TRIALS)
+            self.original_board = [row[:] for row in self.sudoku_numbers]
+        else:
+            sudoku_board = SudokuGenerator(NUM_SQUARES**2, removed_cells)
+            # Solve the board and make a copy
+            sudoku_board.fill_values()
+            self.solved_board = [row[:] for row in sudoku_board.get_board()]
+            # Remove cells and make a copy
+            sudoku_board.remove_cells()
+            self.original_board = [row[:] for row in sudoku_board.get_board()]
+            # Use the modified original_board for sudoku_numbers
+            self.sudoku_numbers = sudoku_board.get_board()
         self.cells = [[Cell(self.sudoku_numbers[row][col], row, col, self.screen)
                        for col in range(NUM_SQUARES**2)]
                       for row in range(NUM_SQUARES**2)]
@@ -158,6 +168,54 @@ class Board:
                 self.cells[row][col].set_cell_value(self.cells[row][col].sketched_value)
             else:
                 self.cells[row][col].set_cell_value(value)
+            if self.cells[row][col].is_editable and self.cells[row][col].value != 0:
+                # The placed value replaces the cell's own notes, so they do not return after a clear
+                self.cells[row][col].clear_pencil_marks()
+                self.remove_pencil_mark_from_peers(row, col, self.cells[row][col].value)
+
+    def toggle_pencil_mark(self, value: int) -> None:
+        """
+        Adds or removes the given value as a pencil mark of the selected cell.
+
+        Parameters:
+        - value (int): The candidate value to toggle.
+        """
+        if self.clicked_cell:
+            row, col = self.clicked_cell
+            self.cells[row][col].toggle_pencil_mark(value)
+
+    def clear_pencil_marks(self) -> None:
+        """
+        Removes all pencil marks of the selected cell.
+        """
+        if self.clicked_cell:
+            row, col = self.clicked_cell
+            self.cells[row][col].clear_pencil_marks()
+
+    def clear_all_pencil_marks(self) -> None:
+        """
+        Removes the pencil marks of every cell on the board.
+        """
+        for row in self.cells:
+            for cell in row:
+                cell.clear_pencil_marks()
+
+    def remove_pencil_mark_from_peers(self, row: int, col: int, value: int) -> None:
+        """
+        Removes the given value from the pencil marks of every cell in the same
+        row, column and box, since it can no longer be placed there.
+
+        Parameters:
+        - row (int): The row of the cell the value was placed in.
+        - col (int): The column of the cell the value was placed in.
+        - value (int): The placed value.
+        """
+        box_row = row - row % NUM_SQUARES
+        box_col = col - col % NUM_SQUARES
+        for i in range(NUM_SQUARES**2):
+            self.cells[row][i].remove_pencil_mark(value)
+            self.cells[i][col].remove_pencil_mark(value)
+            self.cells[box_row + i // NUM_SQUARES][box_col + i % NUM_SQUARES].remove_pencil_mark(value)
 
     def reset_to_original(self) -> None:
         """
@@ -0,0 +1,220 @@
+"""
+Streams a file of 81-character puzzle lines through the solver.
+
+Each input puzzle produces one output line "puzzle,solution". When a puzzle
+cannot be solved the solution field holds the failure status instead
+("malformed", "unsolvable", "multiple" or "unverified"). Input is read lazily
+and only a bounded window of batches is in flight at a time, so memory use
+does not grow with the size of the file. Gzip input is detected automatically.
+
+Usage:
+    python3 bulk_solver.py puzzles.txt.gz -o solutions.txt --jobs 4
+"""
+import argparse
+import collections
+import gzip
+import io
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+from sudoku_solver import parse_puzzle, format_puzzle, find_solutions, is_solution
+
+GZIP_MAGIC = b"\x1f\x8b"
+STATUS_SOLVED = "solved"
+
+
+def open_text(path: str, mode: str = "r"):
+    """
+    Opens a text stream, transparently handling gzip and "-" for stdin/stdout.
+
+    Parameters:
+    - path (str): The file path, or "-" for the standard streams.
+    - mode (str): "r" to read or "w" to write.
+
+    Returns:
+    - A text file object. Input is treated as gzip if it starts with the gzip
+      magic bytes; output is gzip compressed if path ends in ".gz".
+    """
+    if mode == "r":
+        raw = sys.stdin.buffer if path == "-" else open(path, "rb")
+        if not isinstance(raw, io.BufferedReader):
+            raw = io.BufferedReader(raw)
+        if raw.peek(len(GZIP_MAGIC))[:len(GZIP_MAGIC)] == GZIP_MAGIC:
+            raw = gzip.GzipFile(fileobj=raw, mode="rb")
+        return io.TextIOWrapper(raw, encoding="ascii", errors="replace")
+    if path == "-":
+        return sys.stdout
+    if path.endswith(".gz"):
+        return gzip.open(path, "wt", encoding="ascii")
+    return open(path, "w", encoding="ascii")
+
+
+def read_puzzles(stream) -> iter:
+    """
+    Yields the puzzle lines of a stream, skipping blank lines and "#" comments.
+
+    Parameters:
+    - stream: A text file object.
+
+    Returns:
+    - A generator of stripped puzzle lines.
+    """
+    for line in stream:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
+
+
+def batched(items: iter, size: int) -> iter:
+    """
+    Groups an iterable into lists of at most size items.
+    """
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def solve_line(line: str) -> tuple:
+    """
+    Solves and verifies a single puzzle line.
+
+    Parameters:
+    - line (str): The 81-character puzzle.
+
+    Returns:
+    - A tuple (status, output_line).
+    """
+    try:
+        puzzle = parse_puzzle(line)
+    except ValueError:
+        return "malformed", f"{line},malformed"
+    solutions = find_solutions(puzzle, 2)
+    if not solutions:
+        status = "unsolvable"
+    elif len(solutions) > 1:
+        status = "multiple"
+    elif not is_solution(puzzle, solutions[0]):
+        status = "unverified"
+    else:
+        return STATUS_SOLVED, f"{line},{format_puzzle(solutions[0])}"
+    return status, f"{line},{status}"
+
+
+def solve_batch(batch: list) -> list:
+    """
+    Solves a batch of puzzle lines. This is the unit of work sent to a worker.
+    """
+    return [solve_line(line) for line in batch]
+
+
+def map_bounded(func, items: iter, jobs: int, initializer=None, initargs: tuple = ()) -> iter:
+    """
+    Applies func to each item across worker processes, yielding results in input order.
+
+    At most 2 * jobs items are queued at once, so items are consumed only as
+    fast as results are taken from this generator.
+
+    Parameters:
+    - func: The function to apply. It must be picklable (defined at module level).
+    - items (iter): The inputs, typically batches from batched().
+    - jobs (int): The number of worker processes. 1 runs func in this process.
+    - initializer: Optional function run once in each worker (or once here when jobs is 1).
+    - initargs (tuple): Arguments for initializer.
+
+    Returns:
+    - A generator of func results.
+    """
+    if jobs <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(func, items)
+        return
+
+    # Workers are shut down with close/join rather than terminate: once pygame is
+    # initialised, SDL catches SIGTERM and terminate would wait forever
+    pool = multiprocessing.Pool(jobs, initializer, initargs)
+    try:
+        pending = collections.deque()
+        for item in items:
+            pending.append(pool.apply_async(func, (item,)))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.close()
+        pool.join()
+
+
+def solve_stream(lines: iter, jobs: int, batch_size: int) -> iter:
+    """
+    Solves puzzle lines across worker processes, yielding results in input order.
+
+    Parameters:
+    - lines (iter): The puzzle lines.
+    - jobs (int): The number of worker processes. 1 solves in this process.
+    - batch_size (int): The number of puzzles per batch.
+
+    Returns:
+    - A generator of result batches, each a list of (status, output_line).
+    """
+    return map_bounded(solve_batch, batched(lines, batch_size), jobs)
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Solve and verify a file of 81-character Sudoku puzzles.")
+    parser.add_argument("input", help='puzzle file, optionally gzip compressed ("-" for stdin)')
+    parser.add_argument("-o", "--output", default="-",
+                        help='solution file, gzip compressed if it ends in .gz (default: stdout)')
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("-b", "--batch-size", type=int, default=500,
+                        help="puzzles per worker batch and per output write (default: 500)")
+    args = parser.parse_args(argv)
+
+    try:
+        source = open_text(args.input)
+    except OSError as error:
+        parser.error(f"cannot read {args.input}: {error.strerror}")
+
+    counts = collections.Counter()
+    stream_error = None
+    start = time.perf_counter()
+    with source:
+        output = open_text(args.output, "w")
+        try:
+            for results in solve_stream(read_puzzles(source), args.jobs, max(1, args.batch_size)):
+                counts.update(status for status, _ in results)
+                output.write("".join(line + "\n" for _, line in results))
+        except (OSError, EOFError) as error:
+            # A truncated or corrupt gzip file only fails part way through the stream;
+            # keep the output written so far and still report on it
+            stream_error = error
+        finally:
+            if output is not sys.stdout:
+                output.close()
+            else:
+                output.flush()
+    elapsed = time.perf_counter() - start
+
+    total = sum(counts.values())
+    failed = total - counts[STATUS_SOLVED]
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"{total} puzzles in {elapsed:.2f}s ({rate:.1f} puzzles/s), "
+          f"{counts[STATUS_SOLVED]} solved, {failed} failed", file=sys.stderr)
+    for status, count in sorted(counts.items()):
+        if status != STATUS_SOLVED:
+            print(f"  {status}: {count}", file=sys.stderr)
+    if stream_error is not None:
+        print(f"stopped early, {args.input} could not be read to the end: {stream_error}", file=sys.stderr)
+        return 1
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,67 @@
 import pygame
-from constants import NUM_SQUARES, MARGIN, NUM_FONT
+from constants import NUM_SQUARES, MARGIN, NUM_FONT, MARK_FONT, MARK_COLOR, BACKGROUND_COLOR, LINE_WIDTH
+
+# Rendered text is cached because font rendering is far slower than blitting
+_number_surfaces: dict = {}
+_mark_glyphs: dict = {}
+_pencil_mark_surfaces: dict = {}
+
+
+def number_surface(value: int, color: str) -> pygame.Surface:
+    """Return the cached surface of a full-size digit in the given color."""
+    key = (value, color)
+    if key not in _number_surfaces:
+        _number_surfaces[key] = NUM_FONT.render(str(value), False, color)
+    return _number_surfaces[key]
+
+
+def mark_glyph(digit: int) -> pygame.Surface:
+    """Return the cached surface of a mini digit used for pencil marks."""
+    if digit not in _mark_glyphs:
+        _mark_glyphs[digit] = MARK_FONT.render(str(digit), False, MARK_COLOR)
+    return _mark_glyphs[digit]
+
+
+def pencil_mark_surface(marks: int, width: int, height: int) -> pygame.Surface:
+    """
+    Return the cached surface showing all pencil marks of a cell.
+
+    Each candidate digit has a fixed slot in a 3x3 grid (1 top left, 9 bottom right),
+    so a cell full of notes costs a single blit. Composites are built from the cached
+    mini digits of mark_glyph. Transparency uses a colorkey, which blits faster than
+    per-pixel alpha.
+    """
+    key = (marks, width, height)
+    if key not in _pencil_mark_surfaces:
+        surface = pygame.Surface((width, height))
+        surface.fill(BACKGROUND_COLOR)
+        surface.set_colorkey(BACKGROUND_COLOR)
+        # Keep the marks clear of the thick box lines
+        padding = LINE_WIDTH / 2
+        slot_width = (width - 2 * padding) / NUM_SQUARES
+        slot_height = (height - 2 * padding) / NUM_SQUARES
+        for digit in range(1, NUM_SQUARES ** 2 + 1):
+            if marks & (1 << (digit - 1)):
+                mark_surf = mark_glyph(digit)
+                slot_x = padding + (digit - 1) % NUM_SQUARES * slot_width
+                slot_y = padding + (digit - 1) // NUM_SQUARES * slot_height
+                mark_rect = mark_surf.get_rect(center=(slot_x + slot_width / 2, slot_y + slot_height / 2))
+                surface.blit(mark_surf, mark_rect)
+        _pencil_mark_surfaces[key] = surface
+    return _pencil_mark_surfaces[key]
+
 
 class Cell:
     """
     Class to represent a cell on the Sudoku board.
-    
+
     Attributes:
     - value (int): The value of the cell.
     - row (int): The row of the cell.
     - col (int): The column of the cell.
     - screen (pygame.Surface): The screen to draw the cell on.
     - sketched_value (int): The sketched value in the cell.
+    - pencil_marks (int): The candidate digits noted in the cell, bit n - 1 set for digit n.
     - CELL_WIDTH (float): The width of the cell.
     - CELL_HEIGHT (float): The height of the cell.
     - number_pressed (bool): Indicates whether a number is pressed in the cell.
@@ -24,6 +75,7 @@ class Cell:
         self.col = col
         self.screen = screen
         self.sketched_value: int = 0
+        self.pencil_marks: int = 0
         self.CELL_WIDTH: float = (self.screen.get_width() / NUM_SQUARES ** 2)
         self.CELL_HEIGHT: float = ((self.screen.get_height() - MARGIN) / NUM_SQUARES ** 2)
         self.number_pressed: bool = False
@@ -38,6 +90,19 @@ class Cell:
         """Set the sketched value in the cell."""
         self.sketched_value = value
 
+    def toggle_pencil_mark(self, value: int) -> None:
+        """Add or remove value as a pencil mark if the cell is editable."""
+        if self.is_editable:
+            self.pencil_marks ^= 1 << (value - 1)
+
+    def remove_pencil_mark(self, value: int) -> None:
+        """Remove value from the pencil marks."""
+        self.pencil_marks &= ~(1 << (value - 1))
+
+    def clear_pencil_marks(self) -> None:
+        """Remove all pencil marks."""
+        self.pencil_marks = 0
+
     def draw(self) -> None:
         """Draw the cell on the screen."""
         # Create a rectangle representing the cell
@@ -45,7 +110,7 @@ class Cell:
                                      self.CELL_WIDTH + 1, self.CELL_HEIGHT + 1)
         pygame.draw.rect(self.screen, 'Black', self.cell_rect, 1)
 
-        # Draw the value or sketched value in the cell
+        # Draw the value, sketched value or pencil marks in the cell
         if self.value != 0:
             if self.is_editable:
                 self.draw_number('Orange', self.CELL_HEIGHT / 2, self.CELL_WIDTH / 4)
@@ -53,10 +118,12 @@ class Cell:
                 self.draw_number('Black', self.CELL_HEIGHT / 2, self.CELL_WIDTH / 4)
         elif self.sketched_value != 0:
             self.draw_number('Gray', self.CELL_HEIGHT / 10, self.CELL_WIDTH / 10)
+        elif self.pencil_marks != 0:
+            marks_surf = pencil_mark_surface(self.pencil_marks, self.cell_rect.width, self.cell_rect.height)
+            self.screen.blit(marks_surf, self.cell_rect.topleft)
 
     def draw_number(self, color: str, height_offset: float, width_offset: float) -> None:
         """Draw the number or sketched number with the specified color and offsets."""
-        num_surf = NUM_FONT.render(str(self.value if self.value != 0 else self.sketched_value),
-                                   False, color)
+        num_surf = number_surface(self.value if self.value != 0 else self.sketched_value, color)
         self.screen.blit(num_surf, (self.cell_rect.x + height_offset, self.cell_rect.y + width_offset))
         self.number_pressed = True
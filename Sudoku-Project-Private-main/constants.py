@@ -10,3 +10,7 @@ BUTTON_FONT = pygame.font.SysFont(None, 20)
 TEXT_COLOR = (252, 152, 3) # Orange
 BUTTON_COLOR = (0, 0, 0) # Black
 NUM_FONT = pygame.font.SysFont(None, 50)
+MARK_FONT = pygame.font.SysFont(None, 20)
+MARK_COLOR = (128, 128, 128) # Gray
+EXPERT_MAX_CLUES = 22 # Largest clue count of an expert puzzle
+EXPERT_MAX_TRIALS = 10 # Generation trials before settling for the fewest clues found (about 0.1 s each on the UI thread)
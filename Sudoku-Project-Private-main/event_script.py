@@ -0,0 +1,172 @@
+"""
+Event scripts are JSON lines files describing a play session:
+
+    {"type": "session", "seed": 1234}
+    {"type": "game", "difficulty": "easy"}
+    {"type": "click", "frame": 3, "time": 0.512, "pos": [120, 80], "button": 1}
+    {"type": "key", "frame": 5, "time": 0.804, "key": "5", "mod": 0}
+
+"frame" is the iteration of the game loop the event was handled in and "time"
+is the number of seconds since the game started. Keys are stored by their
+pygame.key.name so scripts can be written by hand.
+"""
+import json
+import random
+import time
+import pygame
+
+RECORDED_KEYS = {pygame.K_1, pygame.K_2, pygame.K_3, pygame.K_4, pygame.K_5,
+                 pygame.K_6, pygame.K_7, pygame.K_8, pygame.K_9, pygame.K_RETURN,
+                 pygame.K_DELETE, pygame.K_BACKSPACE, pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT}
+
+
+def event_to_entry(event: pygame.event.Event, frame: int, elapsed: float) -> dict:
+    """
+    Convert a pygame event to a script entry.
+
+    Args:
+        event (pygame.event.Event): The event to convert.
+        frame (int): The game loop iteration the event was handled in.
+        elapsed (float): Seconds since the game started.
+
+    Returns:
+        dict: The script entry, or None if the event is not part of the game input.
+    """
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return {"type": "click", "frame": frame, "time": round(elapsed, 4),
+                "pos": list(event.pos), "button": event.button}
+    if event.type == pygame.KEYDOWN and event.key in RECORDED_KEYS:
+        return {"type": "key", "frame": frame, "time": round(elapsed, 4),
+                "key": pygame.key.name(event.key), "mod": event.mod}
+    return None
+
+
+def entry_to_event(entry: dict) -> pygame.event.Event:
+    """
+    Convert a script entry back to a pygame event.
+
+    Args:
+        entry (dict): A "click" or "key" script entry.
+
+    Returns:
+        pygame.event.Event: The event to post to the queue.
+    """
+    if entry["type"] == "click":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=tuple(entry["pos"]),
+                                  button=entry.get("button", 1))
+    key = pygame.key.key_code(entry["key"])
+    return pygame.event.Event(pygame.KEYDOWN, key=key, mod=entry.get("mod", 0),
+                              unicode="", scancode=0)
+
+
+def load_script(path: str) -> list:
+    """
+    Read an event script.
+
+    Args:
+        path (str): Path to the JSON lines file.
+
+    Returns:
+        list: The script entries in order.
+    """
+    with open(path) as script:
+        return [json.loads(line) for line in script if line.strip()]
+
+
+def save_script(path: str, entries: list) -> None:
+    """
+    Write an event script.
+
+    Args:
+        path (str): Path to the JSON lines file.
+        entries (list): The script entries in order.
+    """
+    with open(path, "w") as script:
+        for entry in entries:
+            script.write(json.dumps(entry) + "\n")
+
+
+def synthetic_script(num_events: int, difficulty: str = "easy", seed: int = 0,
+                     width: int = 600, height: int = 600, margin: int = 100,
+                     pencil_marks: bool = False) -> list:
+    """
+    Build a random but reproducible play session.
+
+    Events are spread over frames the way a fast player would produce them:
+    a click to select a cell, a few arrow moves, digits and Enter or Delete,
+    and optionally pencil marks toggled with shift held.
+
+    Args:
+        num_events (int): Number of input events to generate.
+        difficulty (str): Difficulty of the game to play.
+        seed (int): Seed for both the puzzle and the generated events.
+        width (int): Width of the game screen.
+        height (int): Height of the game screen.
+        margin (int): Height of the button area below the board.
+        pencil_marks (bool): Also toggle and clear pencil marks. This changes the
+            events produced for a given seed, so it is off by default.
+
+    Returns:
+        list: The script entries in order.
+    """
+    rng = random.Random(seed)
+    entries = [{"type": "session", "seed": seed}, {"type": "game", "difficulty": difficulty}]
+    keys = ["up", "down", "left", "right", "return", "return", "delete"] + [str(n) for n in range(1, 10)] * 2
+    frame = 0
+    for _ in range(num_events):
+        frame += rng.randint(1, 3)
+        if rng.random() < 0.15:
+            entries.append({"type": "click", "frame": frame, "time": round(frame / 60, 4),
+                            "pos": [rng.randrange(width), rng.randrange(height - margin)],
+                            "button": 1})
+        elif pencil_marks and rng.random() < 0.3:
+            # Pencil mark toggles and the occasional clear
+            key = rng.choice([str(n) for n in range(1, 10)] * 4 + ["backspace"])
+            entries.append({"type": "key", "frame": frame, "time": round(frame / 60, 4),
+                            "key": key, "mod": pygame.KMOD_LSHIFT if key != "backspace" else 0})
+        else:
+            entries.append({"type": "key", "frame": frame, "time": round(frame / 60, 4),
+                            "key": rng.choice(keys), "mod": 0})
+    return entries
+
+
+class EventRecorder:
+    """
+    Logs the input events of a live game to an event script.
+
+    The puzzle generator is seeded on creation and the seed is written to the
+    script, so a replay plays the same puzzles as the recorded session.
+    """
+
+    def __init__(self, path: str, seed: int = None) -> None:
+        """Open path for writing and seed the puzzle generator."""
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        random.seed(self.seed)
+        self.script = open(path, "w")
+        self.start_time = time.perf_counter()
+        self.write({"type": "session", "seed": self.seed})
+
+    def write(self, entry: dict) -> None:
+        """Append an entry to the script."""
+        self.script.write(json.dumps(entry) + "\n")
+
+    def start_game(self, difficulty: str) -> None:
+        """Mark the start of a new game with the given difficulty."""
+        self.start_time = time.perf_counter()
+        self.write({"type": "game", "difficulty": difficulty})
+
+    def record(self, frame: int, event: pygame.event.Event) -> None:
+        """Log an event handled in the given game loop iteration."""
+        entry = event_to_entry(event, frame, time.perf_counter() - self.start_time)
+        if entry is not None:
+            self.write(entry)
+
+    def close(self) -> None:
+        """Flush and close the script."""
+        self.script.close()
+
+    def __enter__(self) -> "EventRecorder":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,111 @@
+"""
+Generates minimal, uniquely solvable expert puzzles in bulk.
+
+Each trial fills a new solution and runs SudokuGenerator.remove_cells_minimal.
+Trials are independent, so they run in parallel across worker processes until
+enough of them end at or below each target clue count. Puzzles are written as
+81-character lines (the format read by bulk_solver.py) and the throughput for
+each target is reported in puzzles per minute.
+
+Usage:
+    python3 minimal_generator.py --targets 24 22 21 --count 20 -o expert.txt
+"""
+import argparse
+import itertools
+import multiprocessing
+import os
+import random
+import sys
+import time
+from sudoku_generator import SudokuGenerator
+from sudoku_solver import format_puzzle
+
+
+def run_trial(seed: int) -> tuple:
+    """
+    Runs one minimal removal trial.
+
+    Parameters:
+    - seed (int): The seed for the solution and the removal order.
+
+    Returns:
+    - A tuple (clues, puzzle_line).
+    """
+    random.seed(seed)
+    sudoku = SudokuGenerator(9, 0)
+    sudoku.fill_values()
+    clues = sudoku.remove_cells_minimal()
+    return clues, format_puzzle(sudoku.get_board())
+
+
+def generate(target: int, count: int, pool, seeds: iter, jobs: int, max_trials: int) -> tuple:
+    """
+    Runs trials until count puzzles with at most target clues are found.
+
+    Trials are submitted in rounds of a few per worker, so at most one round
+    of extra trials is run once enough puzzles have been found.
+
+    Parameters:
+    - target (int): The largest acceptable number of clues.
+    - count (int): The number of puzzles wanted.
+    - pool: A multiprocessing pool, or None to run trials in this process.
+    - seeds (iter): The source of trial seeds.
+    - jobs (int): The number of worker processes.
+    - max_trials (int): The number of trials after which to give up (None for no limit).
+
+    Returns:
+    - A tuple (puzzles, trials) of the accepted puzzle lines and the trials run.
+    """
+    puzzles = []
+    trials = 0
+    round_size = 4 * jobs
+    while len(puzzles) < count and (max_trials is None or trials < max_trials):
+        size = round_size if max_trials is None else min(round_size, max_trials - trials)
+        round_seeds = list(itertools.islice(seeds, size))
+        results = pool.imap_unordered(run_trial, round_seeds) if pool else map(run_trial, round_seeds)
+        for clues, line in results:
+            trials += 1
+            if clues <= target and len(puzzles) < count:
+                puzzles.append(line)
+    return puzzles, trials
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate minimal expert Sudoku puzzles.")
+    parser.add_argument("-t", "--targets", type=int, nargs="+", default=[22],
+                        help="largest acceptable clue counts, one run per target (default: 22)")
+    parser.add_argument("-n", "--count", type=int, default=10, help="puzzles per target (default: 10)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: all cores)")
+    parser.add_argument("--max-trials", type=int, help="give up on a target after this many trials")
+    parser.add_argument("--seed", type=int, help="seed of the first trial")
+    parser.add_argument("-o", "--output", help="file to append the puzzles to (default: stdout)")
+    args = parser.parse_args(argv)
+
+    first_seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    seeds = itertools.count(first_seed)
+    pool = multiprocessing.Pool(args.jobs) if args.jobs > 1 else None
+    output = open(args.output, "a") if args.output else sys.stdout
+    short = False
+    try:
+        for target in args.targets:
+            start = time.perf_counter()
+            puzzles, trials = generate(target, args.count, pool, seeds, max(1, args.jobs), args.max_trials)
+            elapsed = time.perf_counter() - start
+            output.write("".join(line + "\n" for line in puzzles))
+            output.flush()
+            rate = len(puzzles) / elapsed * 60 if elapsed > 0 else 0.0
+            print(f"target <= {target} clues: {len(puzzles)}/{args.count} puzzles from {trials} trials "
+                  f"in {elapsed:.1f}s ({rate:.1f} puzzles/min)", file=sys.stderr)
+            short = short or len(puzzles) < args.count
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        if output is not sys.stdout:
+            output.close()
+    return 1 if short else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,266 @@
+"""
+Renders puzzles to PNG images without a display, for print books and thumbnails.
+
+Puzzles are read from a file of 81-character lines (optionally gzip compressed,
+and "puzzle,solution" lines from bulk_solver.py are accepted) or generated on
+the fly. Each worker process draws grids onto offscreen surfaces from a cached
+grid template and a cache of digit glyphs, then writes either sprite sheets of
+columns x rows puzzles or one image per puzzle.
+
+Usage:
+    python3 render_batch.py puzzles.txt.gz -o sheets --tile 200 --columns 10 --rows 10
+    python3 render_batch.py --generate 1000 --difficulty expert -o thumbs --individual --tile 90
+"""
+import os
+
+# The drivers have to be chosen before pygame is initialised by the game modules
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import itertools
+import random
+import sys
+import time
+import pygame
+from bulk_solver import batched, map_bounded, open_text, read_puzzles
+from constants import NUM_SQUARES, LINE_COLOR, EXPERT_MAX_CLUES, EXPERT_MAX_TRIALS
+from sudoku_generator import generate_sudoku, generate_minimal_sudoku
+from sudoku_solver import parse_puzzle, format_puzzle
+
+PAGE_COLOR = (255, 255, 255) # White
+REMOVED_CELLS = {"easy": 30, "medium": 40, "hard": 50}
+MAX_INDIVIDUAL_BATCH = 50 # Largest default worker task with --individual
+
+
+class GridRenderer:
+    """
+    Draws puzzles onto offscreen surfaces.
+
+    Attributes:
+    - tile_size (int): The width and height of a rendered puzzle in pixels.
+    - cell_size (float): The width and height of a cell in pixels.
+    - template (pygame.Surface): The empty grid, drawn once and blitted for every puzzle.
+    - glyphs (dict): The rendered surface of each digit.
+    """
+
+    def __init__(self, tile_size: int) -> None:
+        """Build the grid template and the digit glyphs for the given tile size."""
+        pygame.font.init()
+        self.tile_size = tile_size
+        self.cell_size = tile_size / NUM_SQUARES ** 2
+        self.template = self.draw_template()
+        font = pygame.font.Font(None, max(8, round(self.cell_size * 1.1)))
+        # Glyphs have no background: the surface can be taller than the inked digit
+        # and would otherwise cover grid lines next to its cell
+        self.glyphs = {digit: font.render(str(digit), True, LINE_COLOR)
+                       for digit in range(1, NUM_SQUARES ** 2 + 1)}
+        # Glyph top-left offsets that center the inked part of each digit in its cell
+        self.offsets = {}
+        for digit, glyph in self.glyphs.items():
+            ink = glyph.get_bounding_rect()
+            self.offsets[digit] = ((self.cell_size - ink.width) / 2 - ink.x,
+                                   (self.cell_size - ink.height) / 2 - ink.y)
+
+    def draw_template(self) -> pygame.Surface:
+        """
+        Draws the empty grid: thin lines between cells and thick lines around boxes.
+
+        Returns:
+        - The grid surface.
+        """
+        template = pygame.Surface((self.tile_size, self.tile_size))
+        template.fill(PAGE_COLOR)
+        thick = max(2, round(self.tile_size / 60))
+        last = self.tile_size - 1
+        for i in range(NUM_SQUARES ** 2 + 1):
+            # The outer border is inset so all of its thickness stays on the surface
+            position = min(last - thick // 2, max((thick - 1) // 2, round(i * self.cell_size)))
+            width = thick if i % NUM_SQUARES == 0 else 1
+            pygame.draw.line(template, LINE_COLOR, (position, 0), (position, last), width)
+            pygame.draw.line(template, LINE_COLOR, (0, position), (last, position), width)
+        return template
+
+    def draw(self, target: pygame.Surface, board: list, x: int = 0, y: int = 0) -> None:
+        """
+        Draws a puzzle onto target with its top-left corner at (x, y).
+
+        Parameters:
+        - target (pygame.Surface): The surface to draw on.
+        - board (list): A 2D list of ints with 0 for empty cells.
+        - x (int): The left edge of the puzzle on target.
+        - y (int): The top edge of the puzzle on target.
+        """
+        target.blit(self.template, (x, y))
+        glyphs = self.glyphs
+        offsets = self.offsets
+        cell_size = self.cell_size
+        target.blits([(glyphs[value], (x + col * cell_size + offsets[value][0],
+                                       y + row * cell_size + offsets[value][1]))
+                      for row, values in enumerate(board)
+                      for col, value in enumerate(values) if value], doreturn=False)
+
+
+# Per-process renderer and output settings, set up by init_worker
+_renderer = None
+_settings = None
+
+
+def init_worker(tile_size: int, columns: int, gap: int, output_dir: str, individual: bool,
+                difficulty: str, seed: int) -> None:
+    """
+    Sets up the renderer of a worker process.
+    """
+    global _renderer, _settings
+    _renderer = GridRenderer(tile_size)
+    _settings = {"columns": columns, "gap": gap, "output_dir": output_dir,
+                 "individual": individual, "difficulty": difficulty, "seed": seed}
+
+
+def render_batch(batch: tuple) -> int:
+    """
+    Renders a batch of puzzles to disk. This is the unit of work sent to a worker.
+
+    Parameters:
+    - batch (tuple): (index, first, lines), where index numbers the batch, first numbers
+      its first puzzle and lines are the puzzle lines, or the number of puzzles to generate.
+
+    Returns:
+    - The number of puzzles rendered.
+    """
+    index, first, lines = batch
+    if isinstance(lines, int):
+        lines = list(generated_puzzles(lines, _settings["difficulty"], _settings["seed"], first))
+    boards = [parse_puzzle(line) for line in lines]
+    tile_size = _renderer.tile_size
+    output_dir = _settings["output_dir"]
+
+    if _settings["individual"]:
+        surface = pygame.Surface((tile_size, tile_size))
+        for number, board in enumerate(boards, first):
+            _renderer.draw(surface, board)
+            pygame.image.save(surface, os.path.join(output_dir, f"puzzle_{number:07d}.png"))
+        return len(boards)
+
+    columns, gap = _settings["columns"], _settings["gap"]
+    rows = -(-len(boards) // columns)
+    sheet = pygame.Surface((columns * (tile_size + gap) + gap, rows * (tile_size + gap) + gap))
+    sheet.fill(PAGE_COLOR)
+    for number, board in enumerate(boards):
+        row, col = divmod(number, columns)
+        _renderer.draw(sheet, board, gap + col * (tile_size + gap), gap + row * (tile_size + gap))
+    pygame.image.save(sheet, os.path.join(output_dir, f"sheet_{index:05d}.png"))
+    return len(boards)
+
+
+def valid_puzzles(lines: iter, skipped: list) -> iter:
+    """
+    Yields the puzzle part of each line, counting unparsable lines in skipped[0].
+    """
+    for line in lines:
+        puzzle = line.split(",", 1)[0]
+        try:
+            parse_puzzle(puzzle)
+        except ValueError:
+            skipped[0] += 1
+            continue
+        yield puzzle
+
+
+def generated_puzzles(count: int, difficulty: str, seed: int, first: int = 0) -> iter:
+    """
+    Yields count freshly generated puzzles as 81-character lines.
+
+    Each puzzle is seeded by its number, starting at first, so the output does not
+    depend on how puzzles are split into batches or on the number of jobs.
+    """
+    for number in range(first, first + count):
+        random.seed(seed + number)
+        if difficulty == "expert":
+            _, board = generate_minimal_sudoku(NUM_SQUARES ** 2, EXPERT_MAX_CLUES, EXPERT_MAX_TRIALS)
+        else:
+            board = generate_sudoku(NUM_SQUARES ** 2, REMOVED_CELLS[difficulty])
+        yield format_puzzle(board)
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Render Sudoku puzzles to PNG sprite sheets or images.")
+    parser.add_argument("input", nargs="?", help='puzzle file, optionally gzip compressed ("-" for stdin)')
+    parser.add_argument("--generate", type=int, metavar="N", help="render N generated puzzles instead of a file")
+    parser.add_argument("--difficulty", default="hard", choices=["easy", "medium", "hard", "expert"],
+                        help="difficulty of generated puzzles (default: hard)")
+    parser.add_argument("--seed", type=int, help="seed for generated puzzles")
+    parser.add_argument("-o", "--output-dir", default="renders", help="directory for the images (default: renders)")
+    parser.add_argument("--tile", type=int, default=180, help="size of one puzzle in pixels (default: 180)")
+    parser.add_argument("--columns", type=int, default=10, help="puzzles per sheet row (default: 10)")
+    parser.add_argument("--rows", type=int, default=10, help="puzzle rows per sheet (default: 10)")
+    parser.add_argument("--gap", type=int, default=8, help="pixels between puzzles on a sheet (default: 8)")
+    parser.add_argument("--individual", action="store_true", help="write one image per puzzle instead of sheets")
+    parser.add_argument("-b", "--batch-size", type=int,
+                        help="puzzles per worker task with --individual (default: spread generated puzzles "
+                             f"over the workers, at most {MAX_INDIVIDUAL_BATCH} per task)")
+    parser.add_argument("--limit", type=int, help="render at most this many puzzles")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes (default: all cores)")
+    args = parser.parse_args(argv)
+    if args.input is None and args.generate is None:
+        parser.error("either an input file or --generate N is required")
+
+    total = None
+    if args.generate is not None:
+        total = args.generate if args.limit is None else min(args.generate, args.limit)
+    if not args.individual:
+        # A sheet is the unit of work
+        per_batch = max(1, args.columns) * max(1, args.rows)
+    elif args.batch_size is not None:
+        per_batch = max(1, args.batch_size)
+    elif total is not None:
+        # A few tasks per worker so the job is spread over all of them
+        per_batch = max(1, min(MAX_INDIVIDUAL_BATCH, -(-total // (4 * max(1, args.jobs)))))
+    else:
+        per_batch = MAX_INDIVIDUAL_BATCH
+
+    source = None
+    if args.input is not None and args.generate is None:
+        try:
+            source = open_text(args.input)
+        except OSError as error:
+            parser.error(f"cannot read {args.input}: {error.strerror}")
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    skipped = [0]
+    if args.generate is not None:
+        # Workers generate the puzzles themselves; a batch only carries its size
+        batches = ((index, first, min(per_batch, total - first))
+                   for index, first in enumerate(range(0, total, per_batch)))
+    else:
+        lines = valid_puzzles(read_puzzles(source), skipped)
+        if args.limit is not None:
+            lines = itertools.islice(lines, args.limit)
+        batches = ((index, index * per_batch, batch) for index, batch in enumerate(batched(lines, per_batch)))
+    seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+    initargs = (args.tile, max(1, args.columns), max(0, args.gap), args.output_dir,
+                args.individual, args.difficulty, seed)
+
+    images = 0
+    files = 0
+    start = time.perf_counter()
+    try:
+        for rendered in map_bounded(render_batch, batches, args.jobs, init_worker, initargs):
+            images += rendered
+            files += rendered if args.individual else 1
+    finally:
+        if source is not None:
+            source.close()
+    elapsed = time.perf_counter() - start
+
+    rate = images / elapsed if elapsed > 0 else 0.0
+    print(f"{images} puzzles rendered to {files} file(s) in {args.output_dir} in {elapsed:.2f}s "
+          f"({rate:.1f} images/s)", file=sys.stderr)
+    if skipped[0]:
+        print(f"  skipped {skipped[0]} malformed line(s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Replays an event script through the game loop without a display and reports
+how long each event and each frame took.
+
+Record a session with:
+    python3 sudoku.py --record session.jsonl
+then replay it, or a synthetic session, with:
+    python3 replay.py session.jsonl
+    python3 replay.py --synthetic 2000 --difficulty hard --max-frame-ms 20
+"""
+import os
+
+# The drivers have to be chosen before pygame is initialised by the game modules
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import pygame
+from board import Board
+from event_script import entry_to_event, load_script, save_script, synthetic_script
+from sudoku import handle_event, update_frame
+
+
+def percentile(samples: list, fraction: float) -> float:
+    """
+    Return the sample at the given fraction of the sorted samples (nearest rank).
+    """
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: list) -> dict:
+    """
+    Summarize a list of durations in seconds as milliseconds.
+
+    Returns:
+        dict: Count, mean, median, 95th percentile and maximum.
+    """
+    if not samples:
+        return {"count": 0}
+    return {"count": len(samples),
+            "mean_ms": statistics.fmean(samples) * 1000,
+            "p50_ms": percentile(samples, 0.50) * 1000,
+            "p95_ms": percentile(samples, 0.95) * 1000,
+            "max_ms": max(samples) * 1000}
+
+
+def split_games(entries: list) -> tuple:
+    """
+    Split a script into its seed and its games.
+
+    Returns:
+        tuple: (seed, games) where games is a list of (difficulty, events).
+    """
+    seed = None
+    games = []
+    for entry in entries:
+        if entry["type"] == "session":
+            seed = entry.get("seed")
+        elif entry["type"] == "game":
+            games.append((entry["difficulty"], []))
+        elif entry["type"] in ("click", "key"):
+            if not games:
+                games.append(("easy", []))
+            games[-1][1].append(entry)
+    return seed, games
+
+
+def replay(entries: list, width: int = 600, height: int = 600) -> dict:
+    """
+    Feed a script through the game loop, one loop iteration per recorded frame.
+
+    Each frame posts the events recorded for it, handles everything in the
+    event queue with handle_event and then runs update_frame, exactly as main()
+    does. A game ends early if it is won or lost or an event quits or restarts it.
+
+    Args:
+        entries (list): The script entries.
+        width (int): Width of the game screen.
+        height (int): Height of the game screen.
+
+    Returns:
+        dict: Timing summaries per event type and for frames, plus totals.
+    """
+    seed, games = split_games(entries)
+    if seed is not None:
+        random.seed(seed)
+
+    latencies = {"click": [], "key": []}
+    frame_times = []
+    completed = 0
+    start = time.perf_counter()
+    for difficulty, events in games:
+        board = Board(width, height, difficulty)
+        pygame.event.clear()
+        last_frame = events[-1]["frame"] if events else 0
+        position = 0
+        action = None
+        for frame in range(last_frame + 1):
+            while position < len(events) and events[position]["frame"] <= frame:
+                pygame.event.post(entry_to_event(events[position]))
+                position += 1
+
+            for event in pygame.event.get():
+                handle_start = time.perf_counter()
+                action = handle_event(board, event)
+                elapsed = time.perf_counter() - handle_start
+                if event.type == pygame.MOUSEBUTTONDOWN:
+                    latencies["click"].append(elapsed)
+                elif event.type == pygame.KEYDOWN:
+                    latencies["key"].append(elapsed)
+                if action is not None:
+                    break
+            if action is not None:
+                break
+
+            frame_start = time.perf_counter()
+            if update_frame(board) is not None:
+                completed += 1
+                break
+            frame_times.append(time.perf_counter() - frame_start)
+
+    total = time.perf_counter() - start
+    return {"games": len(games),
+            "completed_games": completed,
+            "total_s": total,
+            "fps": len(frame_times) / total if total > 0 else 0.0,
+            "events": {kind: summarize(samples) for kind, samples in latencies.items()},
+            "all_events": summarize(latencies["click"] + latencies["key"]),
+            "frames": summarize(frame_times)}
+
+
+def print_report(report: dict) -> None:
+    """
+    Print a replay report as a table.
+    """
+    print(f"{report['games']} game(s), {report['completed_games']} finished, "
+          f"{report['total_s']:.2f}s total, {report['fps']:.1f} frames/s")
+    rows = [(f"event:{kind}", stats) for kind, stats in report["events"].items()]
+    rows += [("all events", report["all_events"]), ("frames", report["frames"])]
+    print(f"{'':<12}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, stats in rows:
+        if stats["count"] == 0:
+            print(f"{name:<12}{0:>8}")
+            continue
+        print(f"{name:<12}{stats['count']:>8}{stats['mean_ms']:>10.3f}{stats['p50_ms']:>10.3f}"
+              f"{stats['p95_ms']:>10.3f}{stats['max_ms']:>10.3f}")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded or synthetic input through the game loop.")
+    parser.add_argument("script", nargs="?", help="event script recorded with sudoku.py --record")
+    parser.add_argument("--synthetic", type=int, metavar="N",
+                        help="replay N random events instead of a script")
+    parser.add_argument("--difficulty", default="easy", choices=["easy", "medium", "hard", "expert"],
+                        help="difficulty of the synthetic game (default: easy)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the synthetic game")
+    parser.add_argument("--pencil-marks", action="store_true",
+                        help="include pencil mark events in the synthetic game")
+    parser.add_argument("--save", metavar="PATH", help="also write the synthetic script to PATH")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    parser.add_argument("--max-frame-ms", type=float,
+                        help="fail if the 95th percentile frame time exceeds this")
+    parser.add_argument("--max-event-ms", type=float,
+                        help="fail if the 95th percentile event latency exceeds this")
+    args = parser.parse_args(argv)
+
+    if args.synthetic is not None:
+        entries = synthetic_script(args.synthetic, args.difficulty, args.seed,
+                                   pencil_marks=args.pencil_marks)
+        if args.save:
+            save_script(args.save, entries)
+    elif args.script:
+        entries = load_script(args.script)
+    else:
+        parser.error("either a script or --synthetic N is required")
+
+    report = replay(entries)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    failed = False
+    if args.max_frame_ms is not None and report["frames"].get("p95_ms", 0) > args.max_frame_ms:
+        print(f"frame time p95 above {args.max_frame_ms} ms", file=sys.stderr)
+        failed = True
+    if args.max_event_ms is not None and report["all_events"].get("p95_ms", 0) > args.max_event_ms:
+        print(f"event latency p95 above {args.max_event_ms} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,10 @@
+import argparse
+import random
 import pygame
 import sys
 from board import Board
 from constants import *
+from event_script import EventRecorder
 
 pygame.init()
 
@@ -28,7 +31,7 @@ def start_menu(screen: pygame.Surface) -> str:
         screen (pygame.Surface): The game screen.
 
     Returns:
-        str: Selected difficulty ("easy", "medium", or "hard").
+        str: Selected difficulty ("easy", "medium", "hard", or "expert").
     """
     display_image(screen, 'sudoku_img.jpg', 600, 600)
     # Top black box
@@ -46,10 +49,11 @@ def start_menu(screen: pygame.Surface) -> str:
 
     # Difficulty buttons
     button_width, button_height = 130, 50
-    button_spacing = (screen.get_width() - 3 * button_width) / 4
+    button_spacing = (screen.get_width() - 4 * button_width) / 5
     easy_button = pygame.Rect(button_spacing, 500, button_width, button_height)
     medium_button = pygame.Rect(2 * button_spacing + button_width, 500, button_width, button_height)
     hard_button = pygame.Rect(3 * button_spacing + 2 * button_width, 500, button_width, button_height)
+    expert_button = pygame.Rect(4 * button_spacing + 3 * button_width, 500, button_width, button_height)
 
     start_menu = True
     difficulty = None
@@ -68,6 +72,9 @@ def start_menu(screen: pygame.Surface) -> str:
                 elif hard_button.collidepoint(x, y):
                     difficulty = "hard"
                     start_menu = False
+                elif expert_button.collidepoint(x, y):
+                    difficulty = "expert"
+                    start_menu = False
                     
         # Draw the text and buttons
         screen.blit(title_text, title_text_rect)
@@ -75,6 +82,7 @@ def start_menu(screen: pygame.Surface) -> str:
         pygame.draw.rect(screen, 'Black', easy_button)
         pygame.draw.rect(screen, 'Black', medium_button)
         pygame.draw.rect(screen, 'Black', hard_button)
+        pygame.draw.rect(screen, 'Black', expert_button)
 
         easy_text = start_text_font.render('Easy', False, 'White')
         easy_text_rect = easy_text.get_rect(center=easy_button.center)
@@ -88,11 +96,15 @@ def start_menu(screen: pygame.Surface) -> str:
         hard_text_rect = hard_text.get_rect(center=hard_button.center)
         screen.blit(hard_text, hard_text_rect)
 
+        expert_text = start_text_font.render('Expert', False, 'White')
+        expert_text_rect = expert_text.get_rect(center=expert_button.center)
+        screen.blit(expert_text, expert_text_rect)
+
         pygame.display.flip()
 
     return difficulty
 
-def display_game_over(screen: pygame.Surface, width: int, height: int) -> None:
+def display_game_over(screen: pygame.Surface, width: int, height: int, recorder=None) -> None:
     """
     Display the game over screen.
 
@@ -100,6 +112,7 @@ def display_game_over(screen: pygame.Surface, width: int, height: int) -> None:
         screen (pygame.Surface): The game screen.
         width (int): Width of the screen.
         height (int): Height of the screen.
+        recorder (EventRecorder): Optional recorder to keep logging after a restart.
     """
     display_image(screen, 'sudoku_img.jpg', 600, 600)
     
@@ -126,7 +139,7 @@ def display_game_over(screen: pygame.Surface, width: int, height: int) -> None:
                 x, y = pygame.mouse.get_pos()
                 if restart_button.collidepoint(x, y):
                     waiting_for_input = False
-                    main() # Restart the program
+                    main(recorder) # Restart the program
 
 
 def display_game_won(screen: pygame.Surface, width: int, height: int) -> None:
@@ -164,7 +177,96 @@ def display_game_won(screen: pygame.Surface, width: int, height: int) -> None:
                 if exit_button.collidepoint(x, y):
                     sys.exit()
 
-def main():
+def handle_event(board: Board, event: pygame.event.Event) -> str:
+    """
+    Apply a single input event to the board.
+
+    Args:
+        board (Board): The current game board.
+        event (pygame.event.Event): The event to handle.
+
+    Returns:
+        str: "quit" or "restart" if the event ends the current game, otherwise None.
+    """
+    if event.type == pygame.QUIT:
+        return "quit"
+
+    elif event.type == pygame.MOUSEBUTTONDOWN:
+        if event.button == 1:  # Left click
+            x, y = event.pos
+            clicked_cell = board.click(x, y)
+            if clicked_cell:
+                board.select(clicked_cell[0], clicked_cell[1])
+            # Check for button clicks
+            quit_box = pygame.Rect(board.width / 2 - 50, board.height / 2 + 225, 100, 50)
+            if quit_box.collidepoint(x, y):
+                return "quit"
+            reset_box = pygame.Rect(board.width / 2 + 75, board.height / 2 + 225, 100, 50)
+            if reset_box.collidepoint(x, y):
+                board.reset_to_original()
+            restart_box = pygame.Rect(board.width / 2 - 175, board.height / 2 + 225, 100, 50)
+            if restart_box.collidepoint(x, y):
+                return "restart"
+
+    elif event.type == pygame.KEYDOWN:
+        # Sketch the number in the cell, or toggle it as a pencil mark with shift held
+        if pygame.K_1 <= event.key <= pygame.K_9:
+            number_pressed = int(pygame.key.name(event.key))
+            if event.mod & pygame.KMOD_SHIFT:
+                board.toggle_pencil_mark(number_pressed)
+            else:
+                board.sketch(number_pressed)
+        elif event.key == pygame.K_RETURN:  # lock in the sketched number
+            if board.clicked_cell:
+                row, col = board.clicked_cell
+                if board.cells[row][col].sketched_value != 0:
+                    board.place_number(board.cells[row][col].sketched_value)
+                    board.update_board() # Update the 2D array sudoku_numbers
+        # Delete the number in the cell with the delete key
+        elif event.key == pygame.K_DELETE:
+            board.clear()
+        # Clear the pencil marks of the cell, or of the whole board with shift held
+        elif event.key == pygame.K_BACKSPACE:
+            if event.mod & pygame.KMOD_SHIFT:
+                board.clear_all_pencil_marks()
+            else:
+                board.clear_pencil_marks()
+        # Arrow key movement around the board
+        elif event.key == pygame.K_UP:
+            board.move_with_arrow_keys((-1, 0))
+        elif event.key == pygame.K_DOWN:
+            board.move_with_arrow_keys((1, 0))
+        elif event.key == pygame.K_LEFT:
+            board.move_with_arrow_keys((0, -1))
+        elif event.key == pygame.K_RIGHT:
+            board.move_with_arrow_keys((0, 1))
+    return None
+
+def update_frame(board: Board) -> str:
+    """
+    Run the per-frame work of the game loop: check the game state and draw the board.
+
+    Args:
+        board (Board): The board being played.
+
+    Returns:
+        str: "won" or "lost" once the game has ended, in which case nothing is drawn, otherwise None.
+    """
+    if board.check_board():
+        return "won"
+    if board.is_full() and not board.check_board():
+        return "lost"
+    board.draw()
+    pygame.display.flip()
+    return None
+
+def main(recorder=None):
+    """
+    Run the game.
+
+    Args:
+        recorder (EventRecorder): Optional recorder that logs the input event stream.
+    """
     screen = pygame.display.set_mode((600, 600))
     pygame.display.set_caption('Sudoku')
 
@@ -173,68 +275,45 @@ def main():
         sys.exit()
 
     board = Board(600, 600, difficulty)
+    if recorder is not None:
+        recorder.start_game(difficulty)
     running = True
     game_over = False
     game_won = False
+    frame = 0
 
     while running:
         for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+            if recorder is not None:
+                recorder.record(frame, event)
+            action = handle_event(board, event)
+            if action == "quit":
                 sys.exit()
-                
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    x, y = pygame.mouse.get_pos()
-                    clicked_cell = board.click(x, y)
-                    if clicked_cell:
-                        board.select(clicked_cell[0], clicked_cell[1])
-                    # Check for button clicks
-                    quit_box = pygame.Rect(board.width / 2 - 50, board.height / 2 + 225, 100, 50)
-                    if quit_box.collidepoint(x, y):
-                        sys.exit()
-                    reset_box = pygame.Rect(board.width / 2 + 75, board.height / 2 + 225, 100, 50)
-                    if reset_box.collidepoint(x, y):
-                        board.reset_to_original()
-                    restart_box = pygame.Rect(board.width / 2 - 175, board.height / 2 + 225, 100, 50)
-                    if restart_box.collidepoint(x, y):
-                        running = False
-                        main() # Restart the program
-                            
-            elif event.type == pygame.KEYDOWN:
-                # Sketch the number in the cell
-                if pygame.K_1 <= event.key <= pygame.K_9:
-                    number_pressed = int(pygame.key.name(event.key))
-                    board.sketch(number_pressed)
-                elif event.key == pygame.K_RETURN:  # lock in the number
-                    row, col = board.clicked_cell
-                    if board.cells[row][col].number_pressed:
-                        board.place_number(number_pressed)
-                        board.update_board() # Update the 2D array sudoku_numbers
-                # Delete the number in the cell with the delete key
-                elif event.key == pygame.K_DELETE:
-                    board.clear()
-                # Arrow key movement around the board
-                elif event.key == pygame.K_UP:
-                    board.move_with_arrow_keys((-1, 0))
-                elif event.key == pygame.K_DOWN:
-                    board.move_with_arrow_keys((1, 0))
-                elif event.key == pygame.K_LEFT:
-                    board.move_with_arrow_keys((0, -1))
-                elif event.key == pygame.K_RIGHT:
-                    board.move_with_arrow_keys((0, 1))
+            elif action == "restart":
+                running = False
+                main(recorder) # Restart the program
 
         # Game States
-        if board.check_board():
-            display_game_won(screen, board.width, board.height)
-            game_won = True
-
-        if board.is_full() and not board.check_board():
-            display_game_over(screen, board.width, board.height)
-            game_over = True
-            
         if not game_over and not game_won:
-            board.draw()
-            pygame.display.flip()
+            state = update_frame(board)
+            if state == "won":
+                display_game_won(screen, board.width, board.height)
+                game_won = True
+            elif state == "lost":
+                display_game_over(screen, board.width, board.height, recorder)
+                game_over = True
+        frame += 1
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Play Sudoku.")
+    parser.add_argument("--record", metavar="PATH",
+                        help="log the input event stream to PATH for replay.py")
+    parser.add_argument("--seed", type=int, help="seed for puzzle generation")
+    args = parser.parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+    if args.record:
+        with EventRecorder(args.record, args.seed) as recorder:
+            main(recorder)
+    else:
+        main()
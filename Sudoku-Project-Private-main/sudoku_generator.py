@@ -1,4 +1,5 @@
 import math,random
+from sudoku_solver import count_solutions
 
 class SudokuGenerator:
     """
@@ -206,6 +207,60 @@ class SudokuGenerator:
                 self.board[row][col] = 0
                 cells_to_remove -= 1
 
+    def remove_cells_minimal(self):
+        """
+        Removes clues one at a time for as long as the puzzle stays uniquely solvable
+        Every clue is tried once, most promising first: clues with many other clues
+        in their row, column and box, and digits that still appear many times, are
+        the most likely to be removable
+        A clue that cannot be removed now cannot be removed later either, so the
+        resulting puzzle is minimal: removing any remaining clue allows a second solution
+        Should be called after the entire solution has been constructed
+        i.e. after fill_values has been called
+        
+        Parameters: None
+        Return: int (the number of clues left)
+        """
+        # Clue counts per row, column, box and digit, updated as clues are removed
+        row_clues = [0] * self.row_length
+        col_clues = [0] * self.row_length
+        box_clues = [0] * self.row_length
+        digit_clues = [0] * (self.row_length + 1)
+        untried = []
+        for row in range(self.row_length):
+            for col in range(self.row_length):
+                num = self.board[row][col]
+                if num != 0:
+                    box = row // self.box_length * self.box_length + col // self.box_length
+                    row_clues[row] += 1
+                    col_clues[col] += 1
+                    box_clues[box] += 1
+                    digit_clues[num] += 1
+                    untried.append((row, col, box, num))
+        random.shuffle(untried) # random tie-breaking between equally ranked clues
+        clues = len(untried)
+
+        def rank(i):
+            row, col, box, num = untried[i]
+            return row_clues[row] + col_clues[col] + box_clues[box] + digit_clues[num]
+
+        while untried:
+            row, col, box, num = untried.pop(max(range(len(untried)), key=rank))
+            self.board[row][col] = 0
+            # A clue forced by its row, column and box can always be removed;
+            # any other clue needs a full uniqueness check
+            forced = all(not self.is_valid(row, col, other)
+                         for other in range(1, self.row_length + 1) if other != num)
+            if forced or count_solutions(self.board, 2) == 1:
+                clues -= 1
+                row_clues[row] -= 1
+                col_clues[col] -= 1
+                box_clues[box] -= 1
+                digit_clues[num] -= 1
+            else:
+                self.board[row][col] = num
+        return clues
+
 def generate_sudoku(size, removed):
     """
     Generates a Sudoku board of size size x size
@@ -224,3 +279,30 @@ def generate_sudoku(size, removed):
     sudoku.remove_cells()
     board = sudoku.get_board()
     return board
+
+def generate_minimal_sudoku(size, max_clues, max_trials=None):
+    """
+    Generates a minimal, uniquely solvable Sudoku board with at most max_clues clues
+    Each trial fills a new solution and removes clues with remove_cells_minimal
+    until a trial ends at or below max_clues
+    
+    Parameters:
+    - size is the number of rows/columns of the board (9 for this project)
+    - max_clues is the largest acceptable number of clues
+    - max_trials is the number of trials after which the best puzzle so far is returned (None for no limit)
+    
+    Return: tuple (solution, puzzle) of 2D Python lists
+    """
+    best = None
+    trials = 0
+    while max_trials is None or trials < max_trials:
+        trials += 1
+        sudoku = SudokuGenerator(size, 0)
+        sudoku.fill_values()
+        solution = [row[:] for row in sudoku.get_board()]
+        clues = sudoku.remove_cells_minimal()
+        if best is None or clues < best[0]:
+            best = (clues, solution, sudoku.get_board())
+        if clues <= max_clues:
+            break
+    return best[1], best[2]
@@ -0,0 +1,203 @@
+"""
+Bitmask backtracking solver for 9x9 Sudoku boards.
+
+Boards use the same layout as SudokuGenerator: a 2D Python list of ints where
+0 marks an empty cell. Candidates for each row, column and box are tracked as
+9-bit masks (bit 0 is the digit 1), and the search always branches on the
+empty cell with the fewest candidates.
+"""
+
+ROW_LENGTH = 9
+BOX_LENGTH = 3
+NUM_CELLS = ROW_LENGTH * ROW_LENGTH
+ALL_DIGITS = (1 << ROW_LENGTH) - 1
+
+# Lookup tables indexed by flat cell position (row * 9 + col)
+ROW_OF = [i // ROW_LENGTH for i in range(NUM_CELLS)]
+COL_OF = [i % ROW_LENGTH for i in range(NUM_CELLS)]
+BOX_OF = [(i // ROW_LENGTH) // BOX_LENGTH * BOX_LENGTH + (i % ROW_LENGTH) // BOX_LENGTH
+          for i in range(NUM_CELLS)]
+
+# Lookup tables indexed by candidate mask
+POPCOUNT = [bin(mask).count("1") for mask in range(ALL_DIGITS + 1)]
+DIGITS_OF = [[digit for digit in range(1, ROW_LENGTH + 1) if mask & (1 << (digit - 1))]
+             for mask in range(ALL_DIGITS + 1)]
+
+
+def parse_puzzle(line: str) -> list:
+    """
+    Parses an 81-character puzzle line into a 2D board.
+
+    Parameters:
+    - line (str): The puzzle, row by row. Digits 1-9 are clues, '0' or '.' is empty.
+
+    Returns:
+    - A 2D list of ints with 0 for empty cells.
+
+    Raises:
+    - ValueError if the line is not 81 valid characters.
+    """
+    line = line.strip()
+    if len(line) != NUM_CELLS:
+        raise ValueError(f"expected {NUM_CELLS} characters, got {len(line)}")
+    cells = []
+    for char in line:
+        if char == ".":
+            cells.append(0)
+        elif "0" <= char <= "9":
+            cells.append(ord(char) - ord("0"))
+        else:
+            raise ValueError(f"invalid character {char!r}")
+    return [cells[row * ROW_LENGTH:(row + 1) * ROW_LENGTH] for row in range(ROW_LENGTH)]
+
+
+def format_puzzle(board: list) -> str:
+    """
+    Formats a 2D board as an 81-character line, the inverse of parse_puzzle.
+
+    Parameters:
+    - board (list): A 2D list of ints with 0 for empty cells.
+
+    Returns:
+    - The board as a string of digits, row by row.
+    """
+    return "".join(str(value) for row in board for value in row)
+
+
+def _masks(cells: list) -> tuple:
+    """
+    Builds the row, column and box masks of the digits already placed.
+
+    Returns:
+    - A tuple (rows, cols, boxes) of mask lists, or None if a digit is repeated.
+    """
+    rows = [0] * ROW_LENGTH
+    cols = [0] * ROW_LENGTH
+    boxes = [0] * ROW_LENGTH
+    for i, value in enumerate(cells):
+        if value:
+            bit = 1 << (value - 1)
+            row, col, box = ROW_OF[i], COL_OF[i], BOX_OF[i]
+            if (rows[row] | cols[col] | boxes[box]) & bit:
+                return None
+            rows[row] |= bit
+            cols[col] |= bit
+            boxes[box] |= bit
+    return rows, cols, boxes
+
+
+def _search(cells: list, rows: list, cols: list, boxes: list, empties: list,
+            limit: int, solutions: list) -> bool:
+    """
+    Depth-first search that appends every solution found to solutions.
+
+    Returns:
+    - True once limit solutions have been found, which stops the search.
+    """
+    if not empties:
+        solutions.append(cells[:])
+        return len(solutions) >= limit
+
+    # Branch on the empty cell with the fewest candidates
+    best_pos, best_mask, best_count = 0, 0, ROW_LENGTH + 1
+    for pos, i in enumerate(empties):
+        mask = ~(rows[ROW_OF[i]] | cols[COL_OF[i]] | boxes[BOX_OF[i]]) & ALL_DIGITS
+        count = POPCOUNT[mask]
+        if count < best_count:
+            best_pos, best_mask, best_count = pos, mask, count
+            if count <= 1:
+                break
+    if best_count == 0:
+        return False
+
+    i = empties[best_pos]
+    row, col, box = ROW_OF[i], COL_OF[i], BOX_OF[i]
+    empties[best_pos], empties[-1] = empties[-1], empties[best_pos]
+    empties.pop()
+    for digit in DIGITS_OF[best_mask]:
+        bit = 1 << (digit - 1)
+        cells[i] = digit
+        rows[row] |= bit
+        cols[col] |= bit
+        boxes[box] |= bit
+        if _search(cells, rows, cols, boxes, empties, limit, solutions):
+            return True
+        rows[row] ^= bit
+        cols[col] ^= bit
+        boxes[box] ^= bit
+    cells[i] = 0
+    empties.append(i)
+    empties[best_pos], empties[-1] = empties[-1], empties[best_pos]
+    return False
+
+
+def find_solutions(board: list, limit: int = 1) -> list:
+    """
+    Finds up to limit solutions of the board. The board itself is not modified.
+
+    Parameters:
+    - board (list): A 2D list of ints with 0 for empty cells.
+    - limit (int): The maximum number of solutions to look for.
+
+    Returns:
+    - A list of solved 2D boards, empty if the board has no solution.
+    """
+    cells = [value for row in board for value in row]
+    masks = _masks(cells)
+    if masks is None:
+        return []
+    empties = [i for i, value in enumerate(cells) if value == 0]
+    solutions = []
+    _search(cells, *masks, empties, limit, solutions)
+    return [[solution[row * ROW_LENGTH:(row + 1) * ROW_LENGTH] for row in range(ROW_LENGTH)]
+            for solution in solutions]
+
+
+def solve(board: list) -> list:
+    """
+    Solves the board. The board itself is not modified.
+
+    Parameters:
+    - board (list): A 2D list of ints with 0 for empty cells.
+
+    Returns:
+    - The solved 2D board, or None if the board has no solution.
+    """
+    solutions = find_solutions(board, 1)
+    return solutions[0] if solutions else None
+
+
+def count_solutions(board: list, limit: int = 2) -> int:
+    """
+    Counts the solutions of the board, stopping once limit is reached.
+    With the default limit of 2 this is a uniqueness check.
+
+    Parameters:
+    - board (list): A 2D list of ints with 0 for empty cells.
+    - limit (int): The count at which to stop searching.
+
+    Returns:
+    - The number of solutions found, at most limit.
+    """
+    return len(find_solutions(board, limit))
+
+
+def is_solution(puzzle: list, solution: list) -> bool:
+    """
+    Verifies that solution is a complete, valid board that keeps every clue of puzzle.
+
+    Parameters:
+    - puzzle (list): The 2D puzzle with 0 for empty cells.
+    - solution (list): The 2D board to verify.
+
+    Returns:
+    - True if solution solves puzzle, False otherwise.
+    """
+    if len(solution) != ROW_LENGTH or any(len(row) != ROW_LENGTH for row in solution):
+        return False
+    for puzzle_row, solution_row in zip(puzzle, solution):
+        for clue, value in zip(puzzle_row, solution_row):
+            if not 1 <= value <= ROW_LENGTH or (clue and clue != value):
+                return False
+    masks = _masks([value for row in solution for value in row])
+    return masks is not None and all(mask == ALL_DIGITS for unit in masks for mask in unit)